@@ -5,8 +5,9 @@ InkMon JSON 验证脚本
 验证 InkMon JSON 文件是否符合 Schema 和业务规则。
 
 用法:
-    python validate_inkmon.py <json_file>
+    python validate_inkmon.py <json_file> [<json_file> ...]
     python validate_inkmon.py data/inkmons/MossBear.json
+    python validate_inkmon.py data/inkmons/*.json
 
 返回:
     成功: 退出码 0，输出 "[OK] 验证通过"
@@ -17,12 +18,33 @@ import json
 import sys
 import os
 import re
+from operator import itemgetter
 from pathlib import Path
+from typing import Iterable
+
+# 优先使用 orjson（C 实现的 JSON 解析器），未安装时回退到标准库
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Windows 编码兼容
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
 
+# 必需字段（元组保持报错顺序，集合用于一次性求差）
+REQUIRED_FIELDS = (
+    "name", "name_en", "dex_number", "description",
+    "elements", "stats", "design", "evolution", "ecology", "image_prompts"
+)
+REQUIRED_FIELD_SET = frozenset(REQUIRED_FIELDS)
+
+# 六维数值字段
+STAT_FIELDS = ("hp", "attack", "defense", "sp_attack", "sp_defense", "speed")
+STAT_FIELD_SET = frozenset(STAT_FIELDS)
+_GET_STATS = itemgetter(*STAT_FIELDS)
+
 # BST 范围定义
 BST_RANGES = {
     "baby": (250, 350),
@@ -36,6 +58,7 @@ VALID_ELEMENTS = [
     "rock", "ground", "flying", "bug", "poison",
     "dark", "light", "steel", "dragon"
 ]
+VALID_ELEMENT_SET = frozenset(VALID_ELEMENTS)
 
 # 5个必须的风格锚点词
 STYLE_ANCHORS = [
@@ -46,11 +69,29 @@ STYLE_ANCHORS = [
     "non-reflective surface"
 ]
 
+# 锚点词单次扫描：小写锚点 -> 位标记，零宽前瞻保证重叠出现也能被识别
+_ANCHOR_BITS = {anchor.lower(): 1 << i for i, anchor in enumerate(STYLE_ANCHORS)}
+_ALL_ANCHOR_BITS = (1 << len(STYLE_ANCHORS)) - 1
+STYLE_ANCHOR_PATTERN = re.compile(
+    '(?=(' + '|'.join(map(re.escape, _ANCHOR_BITS)) + '))'
+)
+
 # 有效食性
 VALID_DIETS = ["herbivore", "carnivore", "omnivore", "special"]
+VALID_DIET_SET = frozenset(VALID_DIETS)
+
+# 嵌套字段缺省时共用的空映射（只读，避免每次 get 都分配新 dict）
+_EMPTY = {}
+
+# 格式校验正则（模块加载时编译一次）
+NAME_EN_PATTERN = re.compile(r'^[A-Za-z]+$')
+HEX_COLOR_PATTERN = re.compile(r'^#[0-9A-Fa-f]{6}$')
 
 
 class ValidationError:
+    # 批量验证时会大量创建，使用 __slots__ 省去每个实例的 __dict__
+    __slots__ = ("field", "message", "fix_step")
+
     def __init__(self, field: str, message: str, fix_step: int = None):
         self.field = field
         self.message = message
@@ -72,15 +113,12 @@ def validate_inkmon(data: dict) -> list[ValidationError]:
     inkmon = data["inkmon"]
 
     # === 基础字段验证 ===
-    required_fields = [
-        "name", "name_en", "dex_number", "description",
-        "elements", "stats", "design", "evolution", "ecology", "image_prompts"
-    ]
-    for field in required_fields:
-        if field not in inkmon:
-            errors.append(ValidationError(field, f"缺少必需字段 '{field}'"))
-
-    if errors:
+    missing = REQUIRED_FIELD_SET.difference(inkmon)
+    if missing:
+        errors.extend(
+            ValidationError(field, f"缺少必需字段 '{field}'")
+            for field in REQUIRED_FIELDS if field in missing
+        )
         return errors  # 缺少基础字段，无法继续验证
 
     # === 名称验证 ===
@@ -89,13 +127,14 @@ def validate_inkmon(data: dict) -> list[ValidationError]:
         errors.append(ValidationError("name", f"中文名称长度应为 2-4 字符，当前: {len(name)}", 2))
 
     name_en = inkmon.get("name_en", "")
-    if not re.match(r'^[A-Za-z]+$', name_en):
+    if not NAME_EN_PATTERN.match(name_en):
         errors.append(ValidationError("name_en", "英文名称只能包含字母", 2))
     if len(name_en) > 12:
         errors.append(ValidationError("name_en", f"英文名称最长 12 字符，当前: {len(name_en)}", 2))
 
     # === 阶段验证 ===
-    evolution = inkmon.get("evolution", {})
+    # 必需字段已确认存在，直接取值；值为 null 时按空对象处理
+    evolution = inkmon["evolution"] or _EMPTY
     stage = evolution.get("stage", "")
     if stage not in BST_RANGES:
         errors.append(ValidationError(
@@ -106,16 +145,19 @@ def validate_inkmon(data: dict) -> list[ValidationError]:
         return errors  # 阶段无效，无法验证 BST
 
     # === 数值验证 ===
-    stats = inkmon.get("stats", {})
-    stat_fields = ["hp", "attack", "defense", "sp_attack", "sp_defense", "speed"]
+    stats = inkmon["stats"] or _EMPTY
 
     # 检查六维是否存在
-    for stat in stat_fields:
-        if stat not in stats:
-            errors.append(ValidationError(f"stats.{stat}", f"缺少 {stat} 数值", 3))
+    missing_stats = STAT_FIELD_SET.difference(stats)
+    if missing_stats:
+        errors.extend(
+            ValidationError(f"stats.{stat}", f"缺少 {stat} 数值", 3)
+            for stat in STAT_FIELDS if stat in missing_stats
+        )
 
     if not errors:  # 六维都存在，计算总和
-        calculated_bst = sum(stats.get(s, 0) for s in stat_fields)
+        stat_values = _GET_STATS(stats)
+        calculated_bst = sum(stat_values)
         declared_bst = stats.get("bst", 0)
 
         # 检查 BST 计算
@@ -136,8 +178,7 @@ def validate_inkmon(data: dict) -> list[ValidationError]:
             ))
 
         # 检查单项数值范围
-        for stat in stat_fields:
-            val = stats.get(stat, 0)
+        for stat, val in zip(STAT_FIELDS, stat_values):
             if not (1 <= val <= 255):
                 errors.append(ValidationError(
                     f"stats.{stat}",
@@ -146,9 +187,10 @@ def validate_inkmon(data: dict) -> list[ValidationError]:
                 ))
 
     # === 属性验证 ===
-    elements = inkmon.get("elements", {})
+    elements = inkmon["elements"] or _EMPTY
+    # 集合查找前先确认是字符串：列表/对象等不可哈希的值按无效值报错，而不是抛 TypeError
     primary = elements.get("primary")
-    if primary not in VALID_ELEMENTS:
+    if not (isinstance(primary, str) and primary in VALID_ELEMENT_SET):
         errors.append(ValidationError(
             "elements.primary",
             f"无效主属性 '{primary}'，有效值: {', '.join(VALID_ELEMENTS)}",
@@ -156,7 +198,7 @@ def validate_inkmon(data: dict) -> list[ValidationError]:
         ))
 
     secondary = elements.get("secondary")
-    if secondary is not None and secondary not in VALID_ELEMENTS:
+    if secondary is not None and not (isinstance(secondary, str) and secondary in VALID_ELEMENT_SET):
         errors.append(ValidationError(
             "elements.secondary",
             f"无效副属性 '{secondary}'",
@@ -164,7 +206,7 @@ def validate_inkmon(data: dict) -> list[ValidationError]:
         ))
 
     # === 设计验证 ===
-    design = inkmon.get("design", {})
+    design = inkmon["design"] or _EMPTY
     if not design.get("base_animal"):
         errors.append(ValidationError("design.base_animal", "缺少基础动物", 2))
 
@@ -174,7 +216,7 @@ def validate_inkmon(data: dict) -> list[ValidationError]:
 
     colors = design.get("color_palette", [])
     for i, color in enumerate(colors):
-        if not re.match(r'^#[0-9A-Fa-f]{6}$', color):
+        if not HEX_COLOR_PATTERN.match(color):
             errors.append(ValidationError(
                 f"design.color_palette[{i}]",
                 f"无效 HEX 颜色格式: {color}",
@@ -182,9 +224,9 @@ def validate_inkmon(data: dict) -> list[ValidationError]:
             ))
 
     # === 生态验证 ===
-    ecology = inkmon.get("ecology", {})
+    ecology = inkmon["ecology"] or _EMPTY
     diet = ecology.get("diet")
-    if diet not in VALID_DIETS:
+    if not (isinstance(diet, str) and diet in VALID_DIET_SET):
         errors.append(ValidationError(
             "ecology.diet",
             f"无效食性 '{diet}'，有效值: {', '.join(VALID_DIETS)}",
@@ -192,17 +234,22 @@ def validate_inkmon(data: dict) -> list[ValidationError]:
         ))
 
     # === 提示词验证 ===
-    image_prompts = inkmon.get("image_prompts", {})
+    image_prompts = inkmon["image_prompts"] or _EMPTY
     design_prompt = image_prompts.get("design", "").lower()
 
     if not design_prompt:
         errors.append(ValidationError("image_prompts.design", "缺少 design 提示词", 5))
     else:
-        # 检查风格锚点词
-        missing_anchors = []
-        for anchor in STYLE_ANCHORS:
-            if anchor.lower() not in design_prompt:
-                missing_anchors.append(anchor)
+        # 检查风格锚点词（一次扫描记录所有命中的锚点）
+        seen = 0
+        for match in STYLE_ANCHOR_PATTERN.finditer(design_prompt):
+            seen |= _ANCHOR_BITS[match.group(1)]
+            if seen == _ALL_ANCHOR_BITS:
+                break
+        missing_anchors = [
+            anchor for i, anchor in enumerate(STYLE_ANCHORS)
+            if not seen & (1 << i)
+        ]
 
         if missing_anchors:
             errors.append(ValidationError(
@@ -214,12 +261,59 @@ def validate_inkmon(data: dict) -> list[ValidationError]:
     return errors
 
 
+def load_inkmon(json_path: Path) -> dict:
+    """读取并解析 InkMon JSON 文件
+
+    orjson.JSONDecodeError 继承自 json.JSONDecodeError，调用方统一捕获后者即可。
+    """
+    return _json_loads(Path(json_path).read_bytes())
+
+
+def validate_many(paths: Iterable[Path]) -> dict[Path, list[ValidationError]]:
+    """批量验证多个 InkMon JSON 文件，返回 {路径: 错误列表}
+
+    正则、锚点扫描和各类常量集合都在模块加载时构建，批量验证时复用。
+    文件不存在、无法读取（目录、权限不足、编码错误等）或 JSON 解析失败记为 file 字段的错误，
+    单个文件出错不会中断整批验证。
+    """
+    results = {}
+    for path in paths:
+        path = Path(path)
+        if not path.exists():
+            results[path] = [ValidationError("file", f"File not found: {path}")]
+            continue
+        try:
+            data = load_inkmon(path)
+        except json.JSONDecodeError as e:
+            results[path] = [ValidationError("file", f"JSON parse error: {e}")]
+            continue
+        except (OSError, ValueError) as e:
+            results[path] = [ValidationError("file", f"Cannot read file: {e}")]
+            continue
+        results[path] = validate_inkmon(data)
+    return results
+
+
 def main():
     if len(sys.argv) < 2:
-        print("用法: python validate_inkmon.py <json_file>")
+        print("用法: python validate_inkmon.py <json_file> [<json_file> ...]")
         print("示例: python validate_inkmon.py data/inkmons/MossBear.json")
         sys.exit(1)
 
+    if len(sys.argv) > 2:
+        results = validate_many(Path(arg) for arg in sys.argv[1:])
+        failed = 0
+        for path, errors in results.items():
+            if errors:
+                failed += 1
+                print(f"[FAIL] {path}: {len(errors)} error(s)")
+                for error in errors:
+                    print(f"  {error}")
+            else:
+                print(f"[OK] {path}")
+        print(f"\n{len(results) - failed}/{len(results)} file(s) passed")
+        sys.exit(1 if failed else 0)
+
     json_path = Path(sys.argv[1])
 
     if not json_path.exists():
@@ -227,11 +321,13 @@ def main():
         sys.exit(1)
 
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_inkmon(json_path)
     except json.JSONDecodeError as e:
         print(f"[ERROR] JSON parse error: {e}")
         sys.exit(1)
+    except (OSError, ValueError) as e:
+        print(f"[ERROR] Cannot read file: {e}")
+        sys.exit(1)
 
     errors = validate_inkmon(data)
 
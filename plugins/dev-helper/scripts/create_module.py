@@ -11,15 +11,15 @@ create_module.py - 创建标准化的模块追踪文档
 """
 
 import io
-import os
 import re
 import sys
-from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from string import Template
 from typing import List, Optional
 
-# 修复 Windows 控制台编码问题
-if sys.platform == "win32":
+# 修复 Windows 控制台编码问题（控制台已是 UTF-8 时无需重建）
+if sys.platform == "win32" and (sys.stdout.encoding or '').lower() != 'utf-8':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
@@ -32,6 +32,12 @@ def get_template_path() -> Path:
     return template_path
 
 
+@lru_cache(maxsize=None)
+def load_template(template_path: Path) -> str:
+    """读取模板内容（同一进程内只读取一次，供批量创建复用）"""
+    return template_path.read_text(encoding='utf-8')
+
+
 def kebab_to_title(name: str) -> str:
     """将 kebab-case 转换为 Title Case"""
     return ' '.join(word.capitalize() for word in name.split('-'))
@@ -46,7 +52,8 @@ def create_module(
     target_dir: Path,
     module_name: str,
     description: str = "",
-    tracked_paths: Optional[List[str]] = None
+    tracked_paths: Optional[List[str]] = None,
+    date: Optional[str] = None
 ) -> dict:
     """
     创建模块追踪文档
@@ -56,6 +63,7 @@ def create_module(
         module_name: 模块名（kebab-case）
         description: 模块描述
         tracked_paths: 追踪路径列表
+        date: 可选的日期字符串（YYYY-MM-DD），不提供则使用当天
 
     返回:
         {
@@ -93,11 +101,13 @@ def create_module(
         result['error'] = f"模板文件不存在: {template_path}"
         return result
 
-    template_content = template_path.read_text(encoding='utf-8')
+    template_content = load_template(template_path)
+
+    from datetime import datetime
 
     # 准备替换变量
     module_title = kebab_to_title(module_name)
-    date = datetime.now().strftime('%Y-%m-%d')
+    date = date or datetime.now().strftime('%Y-%m-%d')
 
     # 格式化 tracked_paths
     if tracked_paths:
@@ -109,12 +119,13 @@ def create_module(
     if not description:
         description = f"{module_title} module"
 
-    # 替换模板变量
-    content = template_content
-    content = content.replace('${MODULE_TITLE}', module_title)
-    content = content.replace('${DESCRIPTION}', description)
-    content = content.replace('${TRACKED_PATHS}', paths_yaml)
-    content = content.replace('${DATE}', date)
+    # 替换模板变量（单次扫描，替换结果中的 $ 不会被再次解析）
+    content = Template(template_content).safe_substitute(
+        MODULE_TITLE=module_title,
+        DESCRIPTION=description,
+        TRACKED_PATHS=paths_yaml,
+        DATE=date,
+    )
 
     # 写入文件
     output_file.write_text(content, encoding='utf-8')
@@ -124,6 +135,24 @@ def create_module(
     return result
 
 
+def batch_create(target_dir: Path, specs: List[dict]) -> List[dict]:
+    """
+    批量创建模块追踪文档（同一进程内复用模板和日期）
+
+    参数:
+        target_dir: 项目根目录
+        specs: 模块参数列表，每项为 create_module 的关键字参数
+               如 {'module_name': 'auth-system', 'description': '...', 'tracked_paths': [...]}
+
+    返回:
+        与 specs 一一对应的 create_module 结果列表
+    """
+    from datetime import datetime
+
+    date = datetime.now().strftime('%Y-%m-%d')
+    return [create_module(target_dir, date=date, **spec) for spec in specs]
+
+
 def main():
     import argparse
 
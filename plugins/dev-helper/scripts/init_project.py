@@ -4,38 +4,25 @@ dev-helper 项目初始化脚本
 复制 templates/ 目录到目标项目，检查 Git 状态
 """
 
-import json
 import os
-import shutil
-import subprocess
 import sys
 import io
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Dict, Iterator, List
 
-# 修复 Windows 控制台编码问题
-if sys.platform == "win32":
+# 修复 Windows 控制台编码问题（控制台已是 UTF-8 时无需重建）
+if sys.platform == "win32" and (sys.stdout.encoding or '').lower() != 'utf-8':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
 
 def check_git_initialized(target_dir: Path) -> bool:
-    """检查目标目录是否已初始化 Git"""
-    git_dir = target_dir / ".git"
-    if git_dir.is_dir():
-        return True
-
-    # 也检查是否在 Git 仓库的子目录中
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--git-dir"],
-            cwd=target_dir,
-            capture_output=True,
-            text=True
-        )
-        return result.returncode == 0
-    except FileNotFoundError:
-        return False
+    """检查目标目录是否已初始化 Git（包括位于 Git 仓库子目录中的情况）"""
+    # .git 可能是目录，也可能是文件（worktree / submodule）
+    for directory in (target_dir, *target_dir.parents):
+        if (directory / ".git").exists():
+            return True
+    return False
 
 
 def get_templates_dir() -> Path:
@@ -47,6 +34,29 @@ def get_templates_dir() -> Path:
     return templates_dir
 
 
+def _walk_files(directory: str) -> Iterator[os.DirEntry]:
+    """
+    递归遍历目录下的文件（复用 scandir 返回的类型信息，避免额外 stat）
+
+    只进入真实目录；指向目录的符号链接既不进入也不返回，与 rglob + is_dir() 的行为一致。
+    """
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            elif entry.is_file():
+                yield entry
+
+
+def _copy_file(src: str, dst: str, exec_bits: int) -> None:
+    """复制文件内容（不复制时间戳等元数据），仅为可执行模板补上可执行权限"""
+    import shutil
+
+    shutil.copyfile(src, dst)
+    if exec_bits:
+        os.chmod(dst, os.stat(dst).st_mode | exec_bits)
+
+
 def copy_templates(templates_dir: Path, target_dir: Path, force: bool = False) -> Dict[str, List[str]]:
     """
     复制 templates 目录到目标项目
@@ -67,38 +77,45 @@ def copy_templates(templates_dir: Path, target_dir: Path, force: bool = False) -
     if not templates_dir.exists():
         raise FileNotFoundError(f"Templates directory not found: {templates_dir}")
 
-    for src_file in templates_dir.rglob("*"):
-        if src_file.is_dir():
-            continue
+    templates_root = os.fspath(templates_dir)
+    target_root = os.fspath(target_dir)
+    jobs = []
+    parents = set()
 
+    # 扫描阶段完成分类，复制线程之间无需共享 result
+    for entry in _walk_files(templates_root):
         # 计算相对路径
-        rel_path = src_file.relative_to(templates_dir)
-        dst_file = target_dir / rel_path
-
-        # 确保目标目录存在
-        dst_file.parent.mkdir(parents=True, exist_ok=True)
-
-        rel_path_str = str(rel_path).replace("\\", "/")
-
-        if dst_file.exists():
-            if force:
-                # 强制覆盖
-                shutil.copy2(src_file, dst_file)
-                result["updated"].append(rel_path_str)
-            else:
-                # 默认也覆盖（根据用户需求：存在则替换重复文件）
-                shutil.copy2(src_file, dst_file)
-                result["updated"].append(rel_path_str)
+        rel_path = os.path.relpath(entry.path, templates_root)
+        dst_file = os.path.join(target_root, rel_path)
+        parents.add(os.path.dirname(dst_file))
+
+        rel_path_str = rel_path.replace("\\", "/")
+
+        if os.path.lexists(dst_file):
+            # 存在则覆盖（force 与默认行为一致：根据用户需求替换重复文件）
+            result["updated"].append(rel_path_str)
         else:
             # 新建文件
-            shutil.copy2(src_file, dst_file)
             result["created"].append(rel_path_str)
+        jobs.append((entry.path, dst_file, entry.stat().st_mode & 0o111))
+
+    # 确保目标目录存在（一次性创建所有父目录）
+    for parent in sorted(parents):
+        os.makedirs(parent, exist_ok=True)
+
+    # 文件复制相互独立且受 IO 限制，使用线程池并行执行
+    from concurrent.futures import ThreadPoolExecutor
+
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(lambda job: _copy_file(*job), jobs))
 
     return result
 
 
 def main():
     import argparse
+    import json
 
     parser = argparse.ArgumentParser(description="Initialize dev-helper in a project")
     parser.add_argument("target_dir", nargs="?", default=".", help="Target project directory")
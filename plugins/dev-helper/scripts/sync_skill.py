@@ -11,15 +11,14 @@ sync_skill.py - 同步 SKILL.md 的 References 和 Config 区域
 """
 
 import io
-import os
 import re
 import sys
-from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
-# 修复 Windows 控制台编码问题
-if sys.platform == "win32":
+# 修复 Windows 控制台编码问题（控制台已是 UTF-8 时无需重建）
+if sys.platform == "win32" and (sys.stdout.encoding or '').lower() != 'utf-8':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
@@ -35,9 +34,33 @@ REGION_PATTERN = re.compile(
 # YAML 代码块正则
 YAML_BLOCK_PATTERN = re.compile(r'```yaml\s*(.*?)\s*```', re.DOTALL)
 
+# 扫描 references 时直接在原始字节上匹配（Config 区域、Markdown 一级标题），只解码命中的片段
+CONFIG_REGION_MARKER_BYTES = b'<!-- region Generated Config Start -->'
+CONFIG_REGION_BYTES_PATTERN = re.compile(
+    rb'<!-- region Generated Config Start -->\s*'
+    rb'(.*?)'
+    rb'<!-- region Generated Config End -->',
+    re.DOTALL
+)
+TITLE_BYTES_PATTERN = re.compile(rb'^#\s+(.+?)\r?$', re.MULTILINE)
+
+# Core Modules 表格正则（表头、现有行、表格后的 *Run 提示）
+CORE_MODULES_TABLE_PATTERN = re.compile(
+    r'(\| Module \| Description \| Doc \|\s*'
+    r'\|[-\s|]+\|)\s*'
+    r'((?:\|[^\n]+\|\s*)*)'  # 现有行
+    r'(\n\*Run)',
+    re.MULTILINE
+)
+
 
 def parse_yaml_simple(yaml_text: str) -> Dict[str, any]:
-    """简单解析 YAML 文本（不依赖 pyyaml）"""
+    """
+    简单解析 YAML 文本（不依赖 pyyaml）
+
+    模块配置由 create_module 直接把用户输入填进双引号，反斜杠未经转义；
+    这里按字面取值，不使用 libyaml，否则 \\n、\\t 等会被当作转义序列。
+    """
     result = {}
     current_key = None
     current_list = []
@@ -88,40 +111,52 @@ def parse_yaml_simple(yaml_text: str) -> Dict[str, any]:
     return result
 
 
-def read_region(content: str, region_name: str) -> Optional[str]:
-    """读取指定 region 的内容"""
-    pattern = re.compile(
-        rf'<!-- region Generated {region_name} Start -->\s*'
-        rf'(.*?)'
-        rf'<!-- region Generated {region_name} End -->',
-        re.DOTALL
-    )
-    match = pattern.search(content)
-    if match:
-        return match.group(1).strip()
-    return None
-
-
-def write_region(content: str, region_name: str, new_content: str) -> str:
-    """更新指定 region 的内容"""
-    pattern = re.compile(
-        rf'(<!-- region Generated {region_name} Start -->)\s*'
-        rf'.*?'
-        rf'(<!-- region Generated {region_name} End -->)',
-        re.DOTALL
-    )
-    replacement = f'\\1\n{new_content}\n\\2'
-    return pattern.sub(replacement, content)
+def write_regions(content: str, updates: Dict[str, Union[str, Callable[[str], str]]]) -> str:
+    """
+    一次扫描更新多个 region 的内容
+
+    updates 的值可以是新内容字符串，也可以是接收旧内容（已去除首尾空白）、
+    返回新内容的函数；未列出的 region 保持不变。
+    """
+    def replace(match: re.Match) -> str:
+        region_name = match.group(1)
+        update = updates.get(region_name)
+        if update is None:
+            return match.group(0)
+        new_content = update(match.group(2).strip()) if callable(update) else update
+        return (
+            f'<!-- region Generated {region_name} Start -->\n'
+            f'{new_content}\n'
+            f'<!-- region Generated {region_name} End -->'
+        )
+
+    return REGION_PATTERN.sub(replace, content)
 
 
 def parse_module_config(file_path: Path) -> Optional[Dict]:
     """解析模块文件的 Generated Config 区域"""
     try:
-        content = file_path.read_text(encoding='utf-8')
+        raw = file_path.read_bytes()
     except Exception:
         return None
 
-    region_content = read_region(content, 'Config')
+    return parse_module_config_from_bytes(raw, file_path)
+
+
+def parse_module_config_from_bytes(raw: bytes, file_path: Path) -> Optional[Dict]:
+    """从模块文件的原始字节中解析 Generated Config 区域（只解码该区域）"""
+    # 快速预筛：没有 Config 起始标记的文件无需正则匹配
+    if CONFIG_REGION_MARKER_BYTES not in raw:
+        return None
+
+    match = CONFIG_REGION_BYTES_PATTERN.search(raw)
+    if not match:
+        return None
+
+    try:
+        region_content = match.group(1).decode('utf-8').strip()
+    except UnicodeDecodeError:
+        return None
     if not region_content:
         return None
 
@@ -144,10 +179,35 @@ def parse_module_config(file_path: Path) -> Optional[Dict]:
     return config
 
 
-def scan_references(references_dir: Path) -> Tuple[List[Dict], List[Dict]]:
+@lru_cache(maxsize=1024)
+def _parse_module_cached(path_str: str, mtime_ns: int, size: int) -> Optional[Dict]:
+    """按 (路径, mtime, 大小) 缓存模块配置解析结果，文件未变化时跳过读取和解析"""
+    return parse_module_config(Path(path_str))
+
+
+def load_module_config(file_path: Path, use_cache: bool = True) -> Optional[Dict]:
+    """读取模块配置；use_cache 为 True 时复用未修改文件的解析结果"""
+    if not use_cache:
+        return parse_module_config(file_path)
+
+    try:
+        st = file_path.stat()
+    except OSError:
+        return None
+
+    config = _parse_module_cached(str(file_path), st.st_mtime_ns, st.st_size)
+    # 返回副本，避免调用方修改污染缓存
+    return dict(config) if config else config
+
+
+def scan_references(references_dir: Path, use_cache: bool = True) -> Tuple[List[Dict], List[Dict]]:
     """
     扫描 references 目录
 
+    参数:
+        references_dir: references 目录
+        use_cache: 是否复用未修改模块文件的解析结果（长驻进程中多次扫描时有效）
+
     返回:
         (modules, other_files)
         - modules: 模块文件列表 [{name, file, description, tracked_paths, ...}]
@@ -159,12 +219,15 @@ def scan_references(references_dir: Path) -> Tuple[List[Dict], List[Dict]]:
     if not references_dir.exists():
         return modules, other_files
 
+    if not use_cache:
+        _parse_module_cached.cache_clear()
+
     for file_path in sorted(references_dir.glob('*.md')):
         filename = file_path.name
 
         if filename.startswith('module_'):
             # 模块文件
-            config = parse_module_config(file_path)
+            config = load_module_config(file_path, use_cache)
             if config:
                 modules.append(config)
             else:
@@ -179,11 +242,17 @@ def scan_references(references_dir: Path) -> Tuple[List[Dict], List[Dict]]:
             # 其他文件（overview.md, directory.md 等）
             # 尝试从文件内容读取标题
             try:
-                content = file_path.read_text(encoding='utf-8')
-                title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
-                title = title_match.group(1) if title_match else filename
+                raw = file_path.read_bytes()
             except Exception:
-                title = filename
+                raw = None
+
+            title = filename
+            title_match = TITLE_BYTES_PATTERN.search(raw) if raw is not None else None
+            if title_match:
+                try:
+                    title = title_match.group(1).decode('utf-8')
+                except UnicodeDecodeError:
+                    pass
 
             other_files.append({
                 'file': filename,
@@ -195,17 +264,13 @@ def scan_references(references_dir: Path) -> Tuple[List[Dict], List[Dict]]:
 
 def generate_references_content(modules: List[Dict], other_files: List[Dict]) -> str:
     """生成 References 区域内容"""
-    lines = []
-
-    # 先列出固定文件
-    for f in other_files:
-        lines.append(f"- [{f['file']}](references/{f['file']}) - {f['title']}")
-
-    # 再列出模块文件
-    for m in modules:
-        desc = m.get('description', f"{m['name']} module details")
-        lines.append(f"- [{m['file']}](references/{m['file']}) - {desc}")
-
+    # 先列出固定文件，再列出模块文件
+    lines = [f"- [{f['file']}](references/{f['file']}) - {f['title']}" for f in other_files]
+    lines.extend(
+        f"- [{m['file']}](references/{m['file']}) - "
+        f"{m.get('description', m['name'] + ' module details')}"
+        for m in modules
+    )
     return '\n'.join(lines)
 
 
@@ -219,41 +284,32 @@ last_updated: "{date}"
 
 def update_core_modules_table(content: str, modules: List[Dict]) -> str:
     """更新 Core Modules 表格"""
-    # 找到表格位置
-    table_pattern = re.compile(
-        r'(\| Module \| Description \| Doc \|\s*'
-        r'\|[-\s|]+\|)\s*'
-        r'((?:\|[^\n]+\|\s*)*)'  # 现有行
-        r'(\n\*Run)',
-        re.MULTILINE
-    )
-
-    match = table_pattern.search(content)
-    if not match:
-        return content
-
     # 生成新的表格行
-    table_rows = []
-    for m in modules:
-        name = m['name']
-        desc = m.get('description', '')
-        file = m['file']
-        table_rows.append(f"| {name} | {desc} | [详情](references/{file}) |")
-
-    new_rows = '\n'.join(table_rows) + '\n' if table_rows else ''
+    new_rows = ''.join(
+        f"| {m['name']} | {m.get('description', '')} | [详情](references/{m['file']}) |\n"
+        for m in modules
+    )
 
-    # 替换表格内容
-    replacement = f'{match.group(1)}\n{new_rows}{match.group(3)}'
-    return table_pattern.sub(replacement, content)
+    # 替换表格内容（未找到表格时原样返回；函数替换避免描述中的反斜杠被转义）
+    return CORE_MODULES_TABLE_PATTERN.sub(
+        lambda match: f'{match.group(1)}\n{new_rows}{match.group(3)}', content
+    )
 
 
-def sync_skill(target_dir: Path, commit: Optional[str] = None) -> Dict:
+def sync_skill(
+    target_dir: Path,
+    commit: Optional[str] = None,
+    date: Optional[str] = None,
+    use_cache: bool = True
+) -> Dict:
     """
     同步 SKILL.md
 
     参数:
         target_dir: 项目根目录
         commit: 可选的 commit hash，如果不提供则保持原值
+        date: 可选的日期字符串（YYYY-MM-DD），不提供则使用当天；批量同步时可复用
+        use_cache: 是否复用未修改模块文件的解析结果
 
     返回:
         {
@@ -282,29 +338,30 @@ def sync_skill(target_dir: Path, commit: Optional[str] = None) -> Dict:
     content = skill_path.read_text(encoding='utf-8')
 
     # 扫描 references 目录
-    modules, other_files = scan_references(references_dir)
+    modules, other_files = scan_references(references_dir, use_cache)
     result['modules'] = modules
     result['other_files'] = other_files
 
-    # 更新 References 区域
-    refs_content = generate_references_content(modules, other_files)
-    content = write_region(content, 'References', refs_content)
-    result['updated_regions'].append('References')
+    if date is None:
+        from datetime import datetime
+        date = datetime.now().strftime('%Y-%m-%d')
 
-    # 更新 Config 区域
-    if commit is None:
-        # 保持原有 commit
-        config_region = read_region(content, 'Config')
-        if config_region:
+    def render_config(config_region: str) -> str:
+        """生成新的 Config 区域；未指定 commit 时保持原有 commit"""
+        last_commit = commit
+        if last_commit is None:
             yaml_match = YAML_BLOCK_PATTERN.search(config_region)
             if yaml_match:
                 old_config = parse_yaml_simple(yaml_match.group(1))
-                commit = old_config.get('last_tracked_commit', '')
+                last_commit = old_config.get('last_tracked_commit', '')
+        return generate_config_content(last_commit or '', date)
 
-    date = datetime.now().strftime('%Y-%m-%d')
-    config_content = generate_config_content(commit or '', date)
-    content = write_region(content, 'Config', config_content)
-    result['updated_regions'].append('Config')
+    # 一次扫描同时更新 References 和 Config 区域
+    content = write_regions(content, {
+        'References': generate_references_content(modules, other_files),
+        'Config': render_config,
+    })
+    result['updated_regions'].extend(['References', 'Config'])
 
     # 更新 Core Modules 表格
     content = update_core_modules_table(content, modules)
@@ -324,15 +381,20 @@ def main():
     parser.add_argument('target_dir', nargs='?', default='.', help='Target project directory')
     parser.add_argument('--commit', '-c', help='Update last_tracked_commit to this value')
     parser.add_argument('--json', action='store_true', help='Output result as JSON')
+    parser.add_argument('--no-cache', action='store_true', help='Re-parse all module files')
 
     args = parser.parse_args()
     target_dir = Path(args.target_dir).resolve()
 
-    result = sync_skill(target_dir, args.commit)
+    result = sync_skill(target_dir, args.commit, use_cache=not args.no_cache)
 
     if args.json:
-        import json
-        print(json.dumps(result, ensure_ascii=False, indent=2))
+        try:
+            import orjson
+            print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode('utf-8'))
+        except ImportError:
+            import json
+            print(json.dumps(result, ensure_ascii=False, indent=2))
     else:
         if result['success']:
             print('✅ SKILL.md 同步完成')
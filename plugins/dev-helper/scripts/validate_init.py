@@ -4,58 +4,227 @@ dev-helper 初始化校验脚本
 验证项目的 dev-helper 初始化结果是否符合规范
 """
 
+from __future__ import annotations
+
 import os
 import sys
 import re
-import io
+import threading
+from collections.abc import Callable
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Any
+
+# 优先使用 libyaml C 扩展解析 frontmatter，不可用时回退到内置的简单解析器
+try:
+    from yaml import CBaseLoader as _YamlLoader, YAMLError as _YamlError, load as _yaml_load
+except ImportError:
+    _YamlLoader = None
 
 # 修复 Windows 控制台编码问题
 if sys.platform == "win32":
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
+
+
+# frontmatter 块：文件开头的 --- 行到下一个独占一行的 ---（不接受 ---- 之类的分隔行）
+FRONTMATTER_PATTERN = re.compile(r'\A---[ \t]*\r?\n(.*?)^---[ \t]*\r?$\n?', re.DOTALL | re.MULTILINE)
+
+# frontmatter 解析正则（列表项、对象列表项属性、普通键值对、对象列表项的 name）
+LIST_ITEM_PATTERN = re.compile(r'^(\s+)-\s*(.*)$')
+PROP_PATTERN = re.compile(r'^(\s+)(\w+):\s*(.*)$')
+KV_PATTERN = re.compile(r'^(\w+):\s*(.*)$')
+OBJ_NAME_PATTERN = re.compile(r'name:\s*(.+)')
+
+# name 字段格式（kebab-case）允许的字符
+_KEBAB_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789-")
+
+# description 第一人称开头检查：先按首字符快速排除，再做前缀匹配
+_FP_PREFIXES = ("我", "你", "I ", "You ")
+_FIRST_CHARS = frozenset(prefix[0] for prefix in _FP_PREFIXES)
+
+# 命令文件 frontmatter 中的 description 字段
+COMMAND_DESC_PATTERN = re.compile(r'^description:\s*\S+', re.MULTILINE)
+
+# SKILL.md 中的 Generated region（一次搜索同时定位起止标记并取出内容）
+CONFIG_REGION_PATTERN = re.compile(
+    r'<!-- region Generated Config Start -->(.*?)<!-- region Generated Config End -->',
+    re.DOTALL
+)
+REFS_REGION_PATTERN = re.compile(
+    r'<!-- region Generated References Start -->(.*?)<!-- region Generated References End -->',
+    re.DOTALL
+)
+
+# CLAUDE.md 需要出现的标记，一次扫描收集（命中的分组名即标记名；dev-helper 章节名不区分大小写）
+# 标记均为 ASCII，直接在原始字节上匹配，省去整文件 UTF-8 解码
+CLAUDE_MD_TOKEN_PATTERN = re.compile(
+    rb'(?P<dev_helper>## Dev Helper|(?i:## dev-helper))'
+    rb'|(?P<skill>skill:exploring-project)'
+    rb'|(?P<update_arch>/update-arch)'
+    rb'|(?P<session_summary>/session-summary)'
+    rb'|(?P<whats_next>/whats-next)'
+    rb'|(?P<track_module>/track-module)'
+)
+_CLAUDE_MD_TOKEN_COUNT = len(CLAUDE_MD_TOKEN_PATTERN.groupindex)
+
+# SKILL.md 相对项目根目录的路径
+SKILL_MD_PATH = ".claude/skills/exploring-project/SKILL.md"
+
+# 可通过 --checks 选择的校验项（按执行顺序）
+ALL_CHECKS = ("dirs", "skill", "regions", "claude", "commands")
+
+# 初始化后必须存在的目录和文件（相对项目根目录）
+REQUIRED_DIRS = (
+    ".claude/commands",
+    ".claude/skills/exploring-project",
+    ".claude/skills/exploring-project/references",
+    "project-notes",
+)
+REQUIRED_FILES = (
+    SKILL_MD_PATH,
+    ".claude/commands/update-arch.md",
+    ".claude/commands/session-summary.md",
+    ".claude/commands/whats-next.md",
+    ".claude/commands/track-module.md",
+    "CLAUDE.md",
+)
+# 上述路径的父目录，校验时逐个 scandir
+_REQUIRED_PARENT_DIRS = tuple(sorted({os.path.dirname(p) for p in REQUIRED_DIRS + REQUIRED_FILES}))
+
+# 路径类型检查直接使用 os.path 的 C 实现（接受 Path 对象），省去 pathlib 的分派开销
+_isfile = os.path.isfile
+_isdir = os.path.isdir
+
+# 文件内容缓存：路径 -> (mtime_ns, size, 内容)，文件未变化时跳过重复读取和解码
+_TEXT_CACHE: dict[str, tuple[int, int, str]] = {}
+_BYTES_CACHE: dict[str, tuple[int, int, bytes]] = {}
+# 每个路径一把锁：并行校验同时读取同一文件（如 SKILL.md）时只有一个线程真正读取
+_READ_LOCKS: dict[str, threading.Lock] = {}
 
 
 class ValidationResult:
-    def __init__(self):
+    def __init__(self, stream: bool | None = None):
         self.passed = 0
         self.failed = 0
         self.warnings = 0
         self.errors = []
+        # 交互终端下逐条输出；否则先缓冲，最后一次性写出
+        self.stream = sys.stdout.isatty() if stream is None else stream
+        self._buf: list[str] = []
+
+    def _emit(self, text: str):
+        if self.stream:
+            sys.stdout.write(text)
+        else:
+            self._buf.append(text)
+
+    def flush(self):
+        """写出缓冲的输出"""
+        if self._buf:
+            sys.stdout.write("".join(self._buf))
+            self._buf.clear()
+        sys.stdout.flush()
+
+    def section(self, title: str):
+        self._emit(f"\n{title}\n")
 
     def ok(self, msg: str):
         self.passed += 1
-        print(f"  ✅ {msg}")
+        self._emit(f"  ✅ {msg}\n")
 
     def fail(self, msg: str, suggestion: str = ""):
         self.failed += 1
         self.errors.append((msg, suggestion))
-        print(f"  ❌ {msg}")
+        self._emit(f"  ❌ {msg}\n")
         if suggestion:
-            print(f"     💡 {suggestion}")
+            self._emit(f"     💡 {suggestion}\n")
 
     def warn(self, msg: str, suggestion: str = ""):
         self.warnings += 1
-        print(f"  ⚠️ {msg}")
+        self._emit(f"  ⚠️ {msg}\n")
         if suggestion:
-            print(f"     💡 {suggestion}")
+            self._emit(f"     💡 {suggestion}\n")
+
+    def merge(self, other: ValidationResult):
+        """合并另一个（缓冲模式的）结果的计数、错误和输出"""
+        self.passed += other.passed
+        self.failed += other.failed
+        self.warnings += other.warnings
+        self.errors.extend(other.errors)
+        if other._buf:
+            self._emit("".join(other._buf))
+            other._buf.clear()
 
     def is_success(self) -> bool:
         return self.failed == 0
 
 
-def parse_yaml_frontmatter(content: str) -> Optional[Dict[str, Any]]:
-    """简单解析 YAML frontmatter（不依赖 pyyaml）"""
-    if not content.startswith("---"):
-        return None
+def _read_cached(cache: dict[str, tuple], path: str, read: Callable[[str], Any]) -> Any:
+    """按 (mtime_ns, size) 缓存文件读取结果，文件未修改时直接返回缓存内容"""
+    with _READ_LOCKS.setdefault(path, threading.Lock()):
+        st = os.stat(path)
+        key = (st.st_mtime_ns, st.st_size)
+        cached = cache.get(path)
+        if cached is not None and cached[:2] == key:
+            return cached[2]
+        data = read(path)
+        cache[path] = (*key, data)
+        return data
 
-    try:
-        end_idx = content.index("---", 3)
-        frontmatter_text = content[3:end_idx].strip()
-    except ValueError:
-        return None
 
+def _read_text(path: str) -> str:
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def _read_bytes(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _read_text_cached(path: str) -> str:
+    """读取 UTF-8 文本文件（带缓存）"""
+    return _read_cached(_TEXT_CACHE, path, _read_text)
+
+
+def _read_bytes_cached(path: str) -> bytes:
+    """读取文件原始字节（带缓存），用于只做 ASCII 子串检查、无需解码的场景"""
+    return _read_cached(_BYTES_CACHE, path, _read_bytes)
+
+
+def _is_kebab(s: str) -> bool:
+    """是否为 kebab-case（仅小写字母、数字、连字符），用集合包含判断代替正则匹配"""
+    return bool(s) and _KEBAB_CHARS.issuperset(s)
+
+
+def _extract_frontmatter(content: str) -> tuple[str | None, int]:
+    """提取 frontmatter 文本，返回 (frontmatter 文本, body 起始位置)；格式不符时返回 (None, 0)"""
+    match = FRONTMATTER_PATTERN.match(content)
+    if not match:
+        return None, 0
+    return match.group(1), match.end()
+
+
+def _parse_frontmatter_text(frontmatter_text: str) -> dict[str, Any]:
+    """
+    解析已提取的 frontmatter 文本
+
+    有 libyaml 时使用 C 解析器（BaseLoader 保持所有标量为字符串），
+    否则或解析结果不是映射时回退到 _parse_frontmatter_simple。
+    """
+    frontmatter_text = frontmatter_text.strip()
+    if _YamlLoader is not None:
+        try:
+            data = _yaml_load(frontmatter_text, Loader=_YamlLoader)
+        except _YamlError:
+            data = None
+        if isinstance(data, dict):
+            return data
+    return _parse_frontmatter_simple(frontmatter_text)
+
+
+def _parse_frontmatter_simple(frontmatter_text: str) -> dict[str, Any]:
+    """简单解析 frontmatter 文本（不依赖 pyyaml）"""
     result = {}
     current_key = None
     current_list = None
@@ -66,7 +235,7 @@ def parse_yaml_frontmatter(content: str) -> Optional[Dict[str, Any]]:
             continue
 
         # 检查是否是列表项
-        list_match = re.match(r'^(\s+)-\s*(.*)$', line)
+        list_match = LIST_ITEM_PATTERN.match(line)
         if list_match and current_list is not None:
             indent, value = list_match.groups()
             # 简单的列表项
@@ -75,7 +244,7 @@ def parse_yaml_frontmatter(content: str) -> Optional[Dict[str, Any]]:
                 if value.strip().startswith("name:"):
                     # 开始一个新的对象
                     obj = {}
-                    obj_match = re.match(r'name:\s*(.+)', value.strip())
+                    obj_match = OBJ_NAME_PATTERN.match(value.strip())
                     if obj_match:
                         obj['name'] = obj_match.group(1).strip()
                     current_list.append(obj)
@@ -84,7 +253,7 @@ def parse_yaml_frontmatter(content: str) -> Optional[Dict[str, Any]]:
             continue
 
         # 检查是否是对象列表项的后续属性
-        prop_match = re.match(r'^(\s+)(\w+):\s*(.*)$', line)
+        prop_match = PROP_PATTERN.match(line)
         if prop_match and current_list and len(current_list) > 0 and isinstance(current_list[-1], dict):
             indent, key, value = prop_match.groups()
             # 处理数组值
@@ -98,7 +267,7 @@ def parse_yaml_frontmatter(content: str) -> Optional[Dict[str, Any]]:
             continue
 
         # 普通键值对
-        kv_match = re.match(r'^(\w+):\s*(.*)$', line)
+        kv_match = KV_PATTERN.match(line)
         if kv_match:
             key, value = kv_match.groups()
             value = value.strip()
@@ -127,70 +296,79 @@ def parse_yaml_frontmatter(content: str) -> Optional[Dict[str, Any]]:
     return result
 
 
+def _index_entries(root: Path, rel_dirs) -> dict[str, os.DirEntry]:
+    """
+    对给定的相对目录逐个 scandir，返回 {规范化相对路径: DirEntry}
+
+    DirEntry 复用目录枚举时已取得的类型信息，避免对每个路径单独 stat。
+    """
+    root_str = os.fspath(root)
+    index = {}
+    for rel_dir in rel_dirs:
+        try:
+            with os.scandir(os.path.join(root_str, rel_dir)) as it:
+                for entry in it:
+                    rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                    index[os.path.normcase(rel_path)] = entry
+        except OSError:
+            # 目录不存在或不可读，其下的路径都视为缺失
+            continue
+    return index
+
+
 def validate_directory_structure(root: Path, result: ValidationResult):
     """校验目录结构"""
-    print("\n📁 目录结构校验")
-
-    required_paths = [
-        (".claude/commands", "目录"),
-        (".claude/skills/exploring-project", "目录"),
-        (".claude/skills/exploring-project/references", "目录"),
-        (".claude/skills/exploring-project/SKILL.md", "文件"),
-        (".claude/commands/update-arch.md", "文件"),
-        (".claude/commands/session-summary.md", "文件"),
-        (".claude/commands/whats-next.md", "文件"),
-        (".claude/commands/track-module.md", "文件"),
-        ("project-notes", "目录"),
-        ("CLAUDE.md", "文件"),
-    ]
+    result.section("📁 目录结构校验")
 
-    for path, path_type in required_paths:
-        full_path = root / path
-        if path_type == "文件":
-            if full_path.is_file():
-                result.ok(path)
-            else:
-                result.fail(f"{path} 不存在", f"运行 /dev-helper:init 创建")
+    # 只枚举必需路径的父目录，一次 scandir 覆盖同目录下的所有检查项
+    index = _index_entries(root, _REQUIRED_PARENT_DIRS)
+
+    for path in REQUIRED_DIRS:
+        entry = index.get(os.path.normcase(path))
+        if entry is not None and entry.is_dir():
+            result.ok(path)
         else:
-            if full_path.is_dir():
-                result.ok(path)
-            else:
-                result.fail(f"{path}/ 目录不存在", f"运行 mkdir -p {path}")
+            result.fail(f"{path}/ 目录不存在", f"运行 mkdir -p {path}")
+
+    for path in REQUIRED_FILES:
+        entry = index.get(os.path.normcase(path))
+        if entry is not None and entry.is_file():
+            result.ok(path)
+        else:
+            result.fail(f"{path} 不存在", f"运行 /dev-helper:init 创建")
 
 
-def validate_skill_md(root: Path, result: ValidationResult) -> tuple[Optional[Dict[str, Any]], Optional[str]]:
-    """校验 SKILL.md 规范，返回 (frontmatter, content)"""
-    print("\n📄 SKILL.md 规范校验")
+def validate_skill_md(root: Path, result: ValidationResult) -> dict[str, Any] | None:
+    """校验 SKILL.md 规范，返回解析后的 frontmatter"""
+    result.section("📄 SKILL.md 规范校验")
 
-    skill_path = root / ".claude/skills/exploring-project/SKILL.md"
-    if not skill_path.is_file():
+    skill_path = os.path.join(os.fspath(root), SKILL_MD_PATH)
+    if not _isfile(skill_path):
         result.fail("SKILL.md 不存在，跳过内容校验")
-        return None, None
+        return None
 
-    content = skill_path.read_text(encoding="utf-8")
+    # 与 region 校验共用同一份缓存内容，整次运行只读取一次
+    content = _read_text_cached(skill_path)
 
     # 检查 frontmatter
     if not content.startswith("---"):
         result.fail("缺少 YAML frontmatter", "文件应以 --- 开头")
-        return None, content
+        return None
 
-    # 提取 frontmatter
-    try:
-        end_idx = content.index("---", 3)
-        frontmatter_text = content[3:end_idx].strip()
-    except ValueError:
+    # 提取 frontmatter（只匹配一次，解析和 body 定位共用结果）
+    frontmatter_text, body_start = _extract_frontmatter(content)
+    if frontmatter_text is None:
         result.fail("frontmatter 格式错误", "需要用 --- 包裹")
-        return None, content
+        return None
 
     # 解析 frontmatter
-    frontmatter = parse_yaml_frontmatter(content)
-    if frontmatter is None:
-        result.fail("无法解析 frontmatter")
-        return None, content
+    frontmatter = _parse_frontmatter_text(frontmatter_text)
 
-    # 检查 name 字段
+    # 检查 name 字段（libyaml 解析时值可能是映射或列表，非字符串直接报错）
     name = frontmatter.get("name", "")
-    if name:
+    if name and not isinstance(name, str):
+        result.fail("name 必须是字符串", "改为 name: exploring-project")
+    elif name:
         if name == "exploring-project":
             result.ok("name: exploring-project")
         else:
@@ -201,7 +379,7 @@ def validate_skill_md(root: Path, result: ValidationResult) -> tuple[Optional[Di
         else:
             result.fail(f"name 超过 64 字符 ({len(name)})")
 
-        if re.match(r'^[a-z0-9-]+$', name):
+        if _is_kebab(name):
             result.ok("name 格式正确 (kebab-case)")
         else:
             result.fail("name 必须是 kebab-case (小写字母、数字、连字符)")
@@ -210,14 +388,16 @@ def validate_skill_md(root: Path, result: ValidationResult) -> tuple[Optional[Di
 
     # 检查 description 字段
     desc = frontmatter.get("description", "")
-    if desc:
+    if desc and not isinstance(desc, str):
+        result.fail("description 必须是字符串", "使用单行或多行字符串，不要写成映射或列表")
+    elif desc:
         if len(desc) <= 1024:
             result.ok(f"description 长度 ({len(desc)}/1024)")
         else:
             result.fail(f"description 超过 1024 字符 ({len(desc)})")
 
         # 检查第三人称（简单检查：不以 "我" 或 "你" 开头）
-        if not desc.startswith(("我", "你", "I ", "You ")):
+        if not (desc[:1] in _FIRST_CHARS and desc.startswith(_FP_PREFIXES)):
             result.ok("description 使用第三人称")
         else:
             result.fail("description 应使用第三人称", "避免使用 '我'、'你' 开头")
@@ -225,12 +405,12 @@ def validate_skill_md(root: Path, result: ValidationResult) -> tuple[Optional[Di
         result.fail("缺少 description 字段")
 
     # 检查 body 行数
-    body_start = end_idx + 3
-    body_lines = content[body_start:].strip().split("\n")
-    if len(body_lines) <= 500:
-        result.ok(f"body 行数 ({len(body_lines)}/500)")
+    # 直接统计换行符，无需把 body 拆成行列表
+    body_line_count = content[body_start:].strip().count("\n") + 1
+    if body_line_count <= 500:
+        result.ok(f"body 行数 ({body_line_count}/500)")
     else:
-        result.fail(f"body 超过 500 行 ({len(body_lines)})", "将详细内容移到 references/")
+        result.fail(f"body 超过 500 行 ({body_line_count})", "将详细内容移到 references/")
 
     # 检查 References 部分
     if "references/" in content.lower():
@@ -238,28 +418,24 @@ def validate_skill_md(root: Path, result: ValidationResult) -> tuple[Optional[Di
     else:
         result.fail("缺少 references 引用", "添加指向 references/ 目录的链接")
 
-    return frontmatter, content
+    return frontmatter
 
 
 def validate_region_markers(root: Path, content: str, result: ValidationResult):
     """校验 region 标记格式"""
-    print("\n🔗 Region 标记校验")
+    result.section("🔗 Region 标记校验")
 
     if content is None:
         result.fail("无法读取 SKILL.md 内容，跳过 region 校验")
         return
 
     # 检查 Generated Config region
-    config_start = "<!-- region Generated Config Start -->"
-    config_end = "<!-- region Generated Config End -->"
-
-    if config_start in content and config_end in content:
+    config_match = CONFIG_REGION_PATTERN.search(content)
+    if config_match:
         result.ok("Generated Config region 存在")
 
-        # 提取并检查内容
-        start_idx = content.index(config_start) + len(config_start)
-        end_idx = content.index(config_end)
-        config_content = content[start_idx:end_idx].strip()
+        # 检查内容
+        config_content = config_match.group(1).strip()
 
         if "```yaml" in config_content:
             result.ok("Config region 包含 YAML 代码块")
@@ -281,16 +457,12 @@ def validate_region_markers(root: Path, content: str, result: ValidationResult):
                    "添加 <!-- region Generated Config Start --> ... <!-- region Generated Config End -->")
 
     # 检查 Generated References region
-    refs_start = "<!-- region Generated References Start -->"
-    refs_end = "<!-- region Generated References End -->"
-
-    if refs_start in content and refs_end in content:
+    refs_match = REFS_REGION_PATTERN.search(content)
+    if refs_match:
         result.ok("Generated References region 存在")
 
         # 检查是否包含 references 链接
-        start_idx = content.index(refs_start) + len(refs_start)
-        end_idx = content.index(refs_end)
-        refs_content = content[start_idx:end_idx].strip()
+        refs_content = refs_match.group(1).strip()
 
         if "references/" in refs_content:
             result.ok("References region 包含文件链接")
@@ -301,50 +473,66 @@ def validate_region_markers(root: Path, content: str, result: ValidationResult):
                    "添加 <!-- region Generated References Start --> ... <!-- region Generated References End -->")
 
     # 检查 module_*.md 文件
-    references_dir = root / ".claude/skills/exploring-project/references"
-    if references_dir.exists():
-        module_files = list(references_dir.glob("module_*.md"))
-        if module_files:
-            result.ok(f"发现 {len(module_files)} 个模块文件")
-            for mf in module_files:
-                result.ok(f"  - {mf.name}")
+    references_dir = os.path.join(os.fspath(root), ".claude/skills/exploring-project/references")
+    if _isdir(references_dir):
+        # scandir + 前后缀判断代替 glob，DirEntry 自带类型信息，无需逐个构造 Path
+        with os.scandir(references_dir) as it:
+            module_names = sorted(
+                entry.name for entry in it
+                if entry.name.startswith("module_") and entry.name.endswith(".md") and entry.is_file()
+            )
+        if module_names:
+            result.ok(f"发现 {len(module_names)} 个模块文件")
+            for name in module_names:
+                result.ok(f"  - {name}")
         else:
             result.warn("尚未追踪任何模块", "运行 /track-module <name> 添加模块")
 
 
 def validate_claude_md(root: Path, result: ValidationResult):
     """校验 CLAUDE.md"""
-    print("\n📝 CLAUDE.md 校验")
+    result.section("📝 CLAUDE.md 校验")
 
-    claude_path = root / "CLAUDE.md"
-    if not claude_path.is_file():
+    claude_path = os.path.join(os.fspath(root), "CLAUDE.md")
+    if not _isfile(claude_path):
         result.fail("CLAUDE.md 不存在")
         return
 
-    content = claude_path.read_text(encoding="utf-8")
+    content = _read_bytes_cached(claude_path)
+
+    # 一次扫描收集出现过的标记，全部找到即停止
+    seen = set()
+    for match in CLAUDE_MD_TOKEN_PATTERN.finditer(content):
+        seen.add(match.lastgroup)
+        if len(seen) == _CLAUDE_MD_TOKEN_COUNT:
+            break
 
     # 检查 Dev Helper 章节
-    if "## Dev Helper" in content or "## dev-helper" in content.lower():
+    if "dev_helper" in seen:
         result.ok("包含 Dev Helper 章节")
     else:
         result.fail("缺少 ## Dev Helper 章节")
 
     # 检查 skill 激活指令
-    if "skill:exploring-project" in content:
+    if "skill" in seen:
         result.ok("包含 skill:exploring-project 激活指令")
     else:
         result.fail("缺少 skill:exploring-project", "添加 `skill:exploring-project` 激活指令")
 
     # 检查命令列表
-    commands = ["/update-arch", "/session-summary", "/whats-next"]
-    for cmd in commands:
-        if cmd in content:
+    commands = [
+        ("/update-arch", "update_arch"),
+        ("/session-summary", "session_summary"),
+        ("/whats-next", "whats_next"),
+    ]
+    for cmd, token in commands:
+        if token in seen:
             result.ok(f"列出了 {cmd} 命令")
         else:
             result.fail(f"未列出 {cmd} 命令")
 
     # 检查 /track-module 命令（新增）
-    if "/track-module" in content:
+    if "track_module" in seen:
         result.ok("列出了 /track-module 命令")
     else:
         result.warn("未列出 /track-module 命令", "建议添加到命令列表")
@@ -352,7 +540,7 @@ def validate_claude_md(root: Path, result: ValidationResult):
 
 def validate_command_md(root: Path, result: ValidationResult):
     """校验命令文件"""
-    print("\n⚙️ 命令文件校验")
+    result.section("⚙️ 命令文件校验")
 
     commands = [
         "update-arch.md",
@@ -361,50 +549,106 @@ def validate_command_md(root: Path, result: ValidationResult):
         "track-module.md",
     ]
 
+    # 路径保持为 str，用 os.path.join 拼接，避免每个文件构造一次 Path 对象
+    commands_dir = os.path.join(os.fspath(root), ".claude/commands")
     for cmd in commands:
-        cmd_path = root / ".claude/commands" / cmd
-        if not cmd_path.is_file():
+        cmd_path = os.path.join(commands_dir, cmd)
+        if not _isfile(cmd_path):
             result.fail(f"{cmd} 不存在")
             continue
 
-        content = cmd_path.read_text(encoding="utf-8")
+        content = _read_text_cached(cmd_path)
 
         # 检查 frontmatter
         if content.startswith("---"):
-            try:
-                end_idx = content.index("---", 3)
-                frontmatter = content[3:end_idx].strip()
-
+            frontmatter_text, _ = _extract_frontmatter(content)
+            if frontmatter_text is not None:
                 # 检查 description
-                if re.search(r'^description:\s*\S+', frontmatter, re.MULTILINE):
+                if COMMAND_DESC_PATTERN.search(frontmatter_text):
                     result.ok(f"{cmd} description 存在")
                 else:
                     result.fail(f"{cmd} 缺少 description")
-
-            except ValueError:
+            else:
                 result.fail(f"{cmd} frontmatter 格式错误")
         else:
             result.fail(f"{cmd} 缺少 frontmatter")
 
 
+def _parse_checks(value: str) -> tuple[str, ...]:
+    """解析 --checks 参数（逗号分隔），按 ALL_CHECKS 的顺序返回"""
+    import argparse
+
+    selected = {name.strip() for name in value.split(",") if name.strip()}
+    if not selected:
+        raise argparse.ArgumentTypeError(f"至少需要选择一个校验项（可选: {', '.join(ALL_CHECKS)}）")
+    unknown = selected.difference(ALL_CHECKS)
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"未知的校验项: {', '.join(sorted(unknown))}（可选: {', '.join(ALL_CHECKS)}）"
+        )
+    return tuple(name for name in ALL_CHECKS if name in selected)
+
+
+def _validate_region_markers_of(root: Path, result: ValidationResult):
+    """读取 SKILL.md 后校验 region 标记（与 validate_skill_md 共用缓存，并行执行时也只读取一次）"""
+    skill_path = os.path.join(os.fspath(root), SKILL_MD_PATH)
+    content = _read_text_cached(skill_path) if _isfile(skill_path) else None
+    validate_region_markers(root, content, result)
+
+
+# 校验项 -> 校验函数（签名统一为 (root, result)）
+CHECK_FUNCS: dict[str, Callable[[Path, ValidationResult], Any]] = {
+    "dirs": validate_directory_structure,
+    "skill": validate_skill_md,
+    "regions": _validate_region_markers_of,
+    "claude": validate_claude_md,
+    "commands": validate_command_md,
+}
+
+
+def _run_check(name: str, root: Path) -> ValidationResult:
+    """在独立的缓冲结果中执行一项校验，供线程池调用"""
+    part = ValidationResult(stream=False)
+    CHECK_FUNCS[name](root, part)
+    return part
+
+
+def run_checks(root: Path, checks: tuple[str, ...], result: ValidationResult):
+    """
+    执行选中的校验并合并到 result
+
+    各项校验相互独立且以文件 IO 为主，放入线程池并行执行；
+    每项写入自己的缓冲结果，再按 checks 顺序合并，输出顺序保持确定。
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=max(1, len(checks))) as executor:
+        futures = [executor.submit(_run_check, name, root) for name in checks]
+        for future in futures:
+            result.merge(future.result())
+
+
 def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Validate dev-helper initialization')
+    parser.add_argument('root', nargs='?', default=None, help='Project root (default: current directory)')
+    parser.add_argument('--checks', type=_parse_checks, default=ALL_CHECKS,
+                        help=f"Comma-separated checks to run (default: {','.join(ALL_CHECKS)})")
+    args = parser.parse_args()
+
     # 获取项目根目录（从参数或当前目录）
-    if len(sys.argv) > 1:
-        root = Path(sys.argv[1])
-    else:
-        root = Path.cwd()
+    root = Path(args.root) if args.root else Path.cwd()
+    checks = args.checks
 
     print(f"🔍 dev-helper 初始化校验")
     print(f"   项目路径: {root.absolute()}")
 
     result = ValidationResult()
 
-    # 执行各项校验
-    validate_directory_structure(root, result)
-    frontmatter, skill_content = validate_skill_md(root, result)
-    validate_region_markers(root, skill_content, result)
-    validate_claude_md(root, result)
-    validate_command_md(root, result)
+    # 执行选中的校验
+    run_checks(root, checks, result)
+    result.flush()
 
     # 输出总结
     total = result.passed + result.failed